@@ -6,7 +6,7 @@ import pandas as pd
 from typing import Optional
 import os
 from dotenv import load_dotenv
-from services.mcp_client import MCPClient
+from services.mcp_client import MCPClient, flush_scene_writes
 from components.chat import ChatComponent
 from utils.json_loader import load_scene, MeshParseError
 from components.mesh_viewer import MeshViewer
@@ -28,7 +28,14 @@ def parse_uploaded_bytes(data: bytes) -> Optional[Path]:
 	tmp_dir = Path(".cache")
 	tmp_dir.mkdir(exist_ok=True)
 	tmp_file = tmp_dir / "uploaded_scene.json"
-	tmp_file.write_bytes(data)
+	# Reruns hand back the same upload; leaving the file untouched keeps its
+	# mtime, so load_scene serves the cached parse.
+	try:
+		unchanged = tmp_file.stat().st_size == len(data) and tmp_file.read_bytes() == data
+	except FileNotFoundError:
+		unchanged = False
+	if not unchanged:
+		tmp_file.write_bytes(data)
 	return tmp_file
 
 
@@ -86,7 +93,7 @@ def main():
 		st.header("🔧 Grasshopper Integration")
 		if client.mcp_tools_available:
 			st.success("✅ Grasshopper MCP server connected")
-			available_tools = client.grasshopper_client.get_available_tools()
+			available_tools = client.tools
 			if available_tools:
 				st.info(f"🛠️ {len(available_tools)} tools available")
 				if st.checkbox("Show available tools", value=False):
@@ -120,6 +127,7 @@ def main():
 	if scene_ready:
 		generated_path_str = st.session_state.get("generated_scene_path")
 		if generated_path_str:
+			flush_scene_writes()
 			generated_path = Path(generated_path_str)
 			if generated_path.exists():
 				scene = load_scene_safe(generated_path)
@@ -83,9 +83,11 @@ class ChatComponent:
 		if submitted and prompt.strip():
 			self.append("user", prompt.strip())
 			st.session_state["scene_ready"] = False
-			# Pass conversation history for better context
-			response = self.client.send_message(prompt.strip(), conversation_history=self.history[:-1])  # Exclude the just-added user message
-			self.append("assistant", response)
+			# Pass conversation history for better context; render tokens as they arrive
+			response = st.write_stream(
+				self.client.stream_message(prompt.strip(), conversation_history=self.history[:-1])  # Exclude the just-added user message
+			)
+			self.append("assistant", response if isinstance(response, str) else "".join(map(str, response)))
 			st.rerun()
 
 		st.markdown("</div>", unsafe_allow_html=True)  # close chat-pane
@@ -126,12 +126,10 @@ class MeshViewer:
 
 		# Render mesh geometries
 		for idx, mesh in enumerate(self.scene.meshes):
-			if not mesh.faces:
+			if len(mesh.faces) == 0:
 				continue
 			xs, ys, zs = flatten_vertices(mesh.vertices)
-			i_idx = [f[0] for f in mesh.faces]
-			j_idx = [f[1] for f in mesh.faces]
-			k_idx = [f[2] for f in mesh.faces]
+			i_idx, j_idx, k_idx = mesh.faces[:, 0], mesh.faces[:, 1], mesh.faces[:, 2]
 			common_kwargs = dict(
 				x=xs,
 				y=ys,
@@ -10,21 +10,29 @@ We normalize this into triangle indices. Normals/UVs are ignored for now.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List, Tuple, Iterable, Optional, Dict, Any
+from typing import List, Mapping, NamedTuple, Sequence, Tuple, Iterable, Optional, Dict, Any
 import math
 
+import numpy as np
 
-@dataclass(frozen=True)
-class Vertex:
+# Storage dtype for mesh vertex arrays. float32 keeps millimetre precision
+# within a +/-10 km envelope at half the memory traffic of float64. Beam,
+# column and slab coordinates stay Python floats, so code combining them with
+# mesh vertices (e.g. MeshScene.aggregate_bounds) works in float64.
+COORD_DTYPE = np.float32
+
+
+class Vertex(NamedTuple):
 	x: float
 	y: float
 	z: float
 
 	def to_tuple(self) -> Tuple[float, float, float]:
-		return (self.x, self.y, self.z)
+		# A Vertex already is an (x, y, z) tuple.
+		return self
 
 
-@dataclass
+@dataclass(slots=True)
 class BeamGeometry:
 	"""A structural beam defined by start and end points.
 
@@ -42,7 +50,7 @@ class BeamGeometry:
 	end_point: Vertex
 	embodied_carbon: float | None = None  # kgCO2e
 	structural_type: str = "Beam"
-	meta: Dict[str, str] = field(default_factory=dict)
+	meta: Mapping[str, str] = field(default_factory=dict)
 
 	def length(self) -> float:
 		"""Calculate the length of the beam."""
@@ -56,7 +64,7 @@ class BeamGeometry:
 ColumnGeometry = BeamGeometry
 
 
-@dataclass
+@dataclass(slots=True)
 class SlabGeometry:
 	"""Planar slab/floor geometry defined by corner vertices."""
 
@@ -64,12 +72,21 @@ class SlabGeometry:
 	corners: List[Vertex]
 	embodied_carbon: float | None = None
 	structural_type: str = "Floor"
-	meta: Dict[str, str] = field(default_factory=dict)
+	meta: Mapping[str, str] = field(default_factory=dict)
 
 	def area(self) -> float:
-		"""Calculate polygon area using fan triangulation."""
+		"""Calculate polygon area using fan triangulation.
+
+		Planar slabs get the true polygon area, concave ones included, since
+		fan triangles that fold back over the polygon count negatively.
+		Non-planar slabs fall back to the sum of the fan triangle areas.
+		"""
 		if len(self.corners) < 3:
 			return 0.0
+		if len(self.corners) >= 4:
+			planar_area = _planar_fan_area(self.corners)
+			if planar_area is not None:
+				return planar_area
 		area = 0.0
 		p0 = self.corners[0]
 		for i in range(1, len(self.corners) - 1):
@@ -89,45 +106,69 @@ class SlabGeometry:
 	def centroid(self) -> Tuple[float, float, float]:
 		if not self.corners:
 			return (0.0, 0.0, 0.0)
+		sx = sy = sz = 0.0
+		for x, y, z in self.corners:
+			sx += x
+			sy += y
+			sz += z
 		n = len(self.corners)
-		x = sum(v.x for v in self.corners) / n
-		y = sum(v.y for v in self.corners) / n
-		z = sum(v.z for v in self.corners) / n
-		return (x, y, z)
+		return (sx / n, sy / n, sz / n)
 
 
-@dataclass
+@dataclass(slots=True)
+class MeshMeta:
+	"""Identifying metadata carried by a mesh from its source file."""
+
+	uuid: str = ""
+	vertex_count: int = 0
+
+
+@dataclass(slots=True)
 class MeshGeometry:
 	"""A single mesh geometry (triangular).
 
 	Attributes
 	----------
 	name: Optional human-readable identifier.
-	vertices: List of Vertex objects.
-	faces: List of tuples of 3 indices referencing `vertices`.
-	meta: Arbitrary metadata (e.g., uuid, layer).
+	vertices: (N, 3) array of vertex coordinates (COORD_DTYPE).
+	faces: (M, 3) integer array of indices referencing `vertices`.
+	meta: Source metadata (uuid, vertex count).
+
+	Coordinates are stored as float32: about 7 significant digits, i.e.
+	better than 1 mm for models within +/-10 km of the origin. Inputs of
+	any other dtype (or plain sequences) are converted on construction.
 	"""
 
 	name: str
-	vertices: List[Vertex]
-	faces: List[Tuple[int, int, int]]
-	meta: Dict[str, str] = field(default_factory=dict)
+	vertices: np.ndarray
+	faces: np.ndarray
+	meta: MeshMeta = field(default_factory=MeshMeta)
 	embodied_carbon: float | None = None  # kgCO2e (per mesh aggregate)
 	structural_type: str = None  # e.g., "Beam", "Floor", etc.
 
+	def __post_init__(self):
+		# No-ops (no copy) for arrays that already have the storage dtypes
+		self.vertices = np.asarray(self.vertices, dtype=COORD_DTYPE).reshape(-1, 3)
+		self.faces = np.asarray(self.faces, dtype=np.int32).reshape(-1, 3)
+
 	def vertex_count(self) -> int:
 		return len(self.vertices)
 
+	def vertex(self, i: int) -> Vertex:
+		"""Named-field view of vertex `i`, for code that is not vectorized."""
+		x, y, z = self.vertices[i].tolist()
+		return Vertex(x, y, z)
+
 	def face_count(self) -> int:
 		return len(self.faces)
 
 	def bounds(self) -> Tuple[Tuple[float, float, float], Tuple[float, float, float]]:
-		if not self.vertices:
+		if len(self.vertices) == 0:
 			return (0.0, 0.0, 0.0), (0.0, 0.0, 0.0)
-		xs = [v.x for v in self.vertices]
-		ys = [v.y for v in self.vertices]
-		zs = [v.z for v in self.vertices]
-		return (min(xs), min(ys), min(zs)), (max(xs), max(ys), max(zs))
+		xyz = np.asarray(self.vertices)
+		mn = xyz.min(axis=0).tolist()
+		mx = xyz.max(axis=0).tolist()
+		return (mn[0], mn[1], mn[2]), (mx[0], mx[1], mx[2])
 
 	def bounding_box_volume(self) -> float:
 		(minx, miny, minz), (maxx, maxy, maxz) = self.bounds()
@@ -156,21 +197,31 @@ class MeshScene:
 		return mesh_faces + slab_faces
 
 	def aggregate_bounds(self) -> Tuple[Tuple[float, float, float], Tuple[float, float, float]]:
-		points: List[Tuple[float, float, float]] = []
-		for mesh in self.meshes:
-			points.extend(v.to_tuple() for v in mesh.vertices)
-		for beam in self.beams:
-			points.append(beam.start_point.to_tuple())
-			points.append(beam.end_point.to_tuple())
-		for column in self.columns:
-			points.append(column.start_point.to_tuple())
-			points.append(column.end_point.to_tuple())
-		for slab in self.slabs:
-			points.extend(v.to_tuple() for v in slab.corners)
-		if not points:
+		total = (
+			sum(m.vertex_count() for m in self.meshes)
+			+ 2 * len(self.beams)
+			+ 2 * len(self.columns)
+			+ sum(len(s.corners) for s in self.slabs)
+		)
+		if total == 0:
 			return (0.0, 0.0, 0.0), (0.0, 0.0, 0.0)
-		xs, ys, zs = zip(*points)
-		return (min(xs), min(ys), min(zs)), (max(xs), max(ys), max(zs))
+		# float64 so beam/slab coordinates are not rounded and stay inside the bounds
+		buf = np.empty((total, 3), dtype=np.float64)
+		i = 0
+		for mesh in self.meshes:
+			k = mesh.vertex_count()
+			if k:
+				buf[i : i + k] = mesh.vertices
+				i += k
+		endpoints = [p for elem in (*self.beams, *self.columns) for p in (elem.start_point, elem.end_point)]
+		corners = [v for slab in self.slabs for v in slab.corners]
+		for points in (endpoints, corners):
+			if points:
+				buf[i : i + len(points)] = points
+				i += len(points)
+		mn = buf.min(axis=0).tolist()
+		mx = buf.max(axis=0).tolist()
+		return (mn[0], mn[1], mn[2]), (mx[0], mx[1], mx[2])
 
 	def summary(self) -> List[Dict[str, float]]:
 		rows = []
@@ -247,7 +298,9 @@ class MeshScene:
 		return rows
 
 
-def flatten_vertices(vertices: Iterable[Vertex]) -> Tuple[List[float], List[float], List[float]]:
+def flatten_vertices(vertices: Iterable[Vertex] | np.ndarray) -> Tuple[Sequence[float], Sequence[float], Sequence[float]]:
+	if isinstance(vertices, np.ndarray):
+		return vertices[:, 0], vertices[:, 1], vertices[:, 2]
 	xs, ys, zs = [], [], []
 	for v in vertices:
 		xs.append(v.x)
@@ -256,11 +309,44 @@ def flatten_vertices(vertices: Iterable[Vertex]) -> Tuple[List[float], List[floa
 	return xs, ys, zs
 
 
+def _cross(a: Vertex, b: Vertex, c: Vertex) -> Tuple[float, float, float]:
+	"""Cross product of (b - a) and (c - a)."""
+	abx, aby, abz = b.x - a.x, b.y - a.y, b.z - a.z
+	acx, acy, acz = c.x - a.x, c.y - a.y, c.z - a.z
+	return (aby * acz - abz * acy, abz * acx - abx * acz, abx * acy - aby * acx)
+
+
 def _triangle_area(a: Vertex, b: Vertex, c: Vertex) -> float:
-	ab = (b.x - a.x, b.y - a.y, b.z - a.z)
-	ac = (c.x - a.x, c.y - a.y, c.z - a.z)
-	cross_x = ab[1] * ac[2] - ab[2] * ac[1]
-	cross_y = ab[2] * ac[0] - ab[0] * ac[2]
-	cross_z = ab[0] * ac[1] - ab[1] * ac[0]
+	cross_x, cross_y, cross_z = _cross(a, b, c)
 	return 0.5 * math.sqrt(cross_x**2 + cross_y**2 + cross_z**2)
 
+
+def _planar_fan_area(corners: List[Vertex], rel_tol: float = 1e-9) -> Optional[float]:
+	"""Area of a planar polygon from its signed fan triangles, using a single sqrt.
+
+	Every fan triangle of a planar polygon is parallel to the first
+	non-degenerate one, so the signed areas (cross product projected onto
+	that normal) can be summed and the sqrt taken once. For a concave
+	polygon this is the true area, not the sum of the triangle areas.
+	Returns None when all fan triangles are degenerate or the corners are
+	not coplanar.
+	"""
+	p0 = corners[0]
+	for i in range(1, len(corners) - 1):
+		# Leading collinear corners give a zero normal; use the next triangle
+		nx, ny, nz = _cross(p0, corners[i], corners[i + 1])
+		norm = math.sqrt(nx * nx + ny * ny + nz * nz)
+		if norm != 0.0:
+			break
+	else:
+		return None
+	nx, ny, nz = nx / norm, ny / norm, nz / norm
+	total = 0.0
+	for i in range(1, len(corners) - 1):
+		cx, cy, cz = _cross(p0, corners[i], corners[i + 1])
+		signed = nx * cx + ny * cy + nz * cz
+		mag2 = cx * cx + cy * cy + cz * cz
+		if mag2 - signed * signed > rel_tol * mag2:
+			return None
+		total += signed
+	return 0.5 * abs(total)
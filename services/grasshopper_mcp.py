@@ -3,14 +3,46 @@
 Direct integration with the Grasshopper compute functions without MCP overhead.
 """
 
-import importlib.util
-import sys
-from pathlib import Path
 from typing import Dict, Any, List
 import logging
 
+__all__ = ["DirectGrasshopperClient", "SyncGrasshopperMCPClient"]
+
 logger = logging.getLogger(__name__)
 
+# Static OpenAI function-calling schema, built once at import time.
+_FUNCTION_SCHEMA = {
+    "description": "Calculate embodied carbon of a building given bay width, bay height, and story height",
+    "parameters": {
+        "type": "object",
+        "properties": {
+            "xBaySize": {
+                "type": "number",
+                "description": "Bay width in X direction"
+            },
+            "yBaySize": {
+                "type": "number",
+                "description": "Bay width in Y direction"
+            },
+            "storyHeight": {
+                "type": "number",
+                "description": "story height"
+            }
+        },
+        "required": ["xBaySize", "yBaySize", "storyHeight"]
+    }
+}
+
+_TOOLS_SCHEMA: List[Dict[str, Any]] = [
+    {
+        "type": "function",
+        "function": {"name": "calculateBuildingEmbodiedCarbon", **_FUNCTION_SCHEMA}
+    }
+]
+
+# "compute_mcp" is the legacy name of the same tool; still accepted by call_tool.
+_TOOL_NAMES = {"calculateBuildingEmbodiedCarbon", "compute_mcp"}
+
 
 class DirectGrasshopperClient:
     """Direct client for Grasshopper compute functions."""
@@ -37,51 +69,14 @@ class DirectGrasshopperClient:
     
     def get_available_tools(self) -> List[Dict[str, Any]]:
         """Get available tools formatted for OpenAI function calling."""
-        if not self.available:
-            return []
-        
-        # Define the add_numbers_via_compute function for OpenAI
-        function_schema = {
-            "description": "Calculate embodied carbon of a building given bay width, bay height, and story height",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "xBaySize": {
-                        "type": "number",
-                        "description": "Bay width in X direction"
-                    },
-                    "yBaySize": {
-                        "type": "number",
-                        "description": "Bay width in Y direction"
-                    },
-                    "storyHeight": {
-                        "type": "number",
-                        "description": "story height"
-                    }
-                },
-                "required": ["xBaySize", "yBaySize", "storyHeight"]
-            }
-        }
-
-        tools = [
-            {
-                "type": "function",
-                "function": {"name": "calculateBuildingEmbodiedCarbon", **function_schema}
-            },
-            {
-                "type": "function",
-                "function": {"name": "compute_mcp", **function_schema}
-            }
-        ]
-        
-        return tools
+        return _TOOLS_SCHEMA if self.available else []
     
     def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
         """Call a Grasshopper compute function."""
         if not self.available:
             raise RuntimeError("Grasshopper compute module not available")
         
-        if tool_name in {"calculateBuildingEmbodiedCarbon", "compute_mcp"}:
+        if tool_name in _TOOL_NAMES:
             try:
                 xBaySize = float(arguments.get("xBaySize", 0))
                 yBaySize = float(arguments.get("yBaySize", 0))
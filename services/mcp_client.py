@@ -6,12 +6,374 @@ server for computational tools.
 """
 
 import openai
+import functools
+import hashlib
+import importlib.util
 import json
+import logging
+import os
+import random
+import re
+import shelve
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Generator, Iterator, List, Dict, Any, Optional, Tuple
+import httpx
 import streamlit as st
 from .grasshopper_mcp import DirectGrasshopperClient
 
+try:
+    import orjson
+except ImportError:  # optional: fall back to the stdlib encoder
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Client-side pacing for gpt-4o-mini. Lower these to stay under the quota of
+# the account in use; the buckets are shared by every MCPClient instance.
+REQUESTS_PER_MINUTE = 500
+TOKENS_PER_MINUTE = 200_000
+MAX_RATE_LIMIT_RETRIES = 5
+
+# Session-state key holding the id of the last stored response; the next turn
+# continues from it instead of resending the conversation history.
+LAST_RESPONSE_KEY = "last_response_id"
+
+# Session-state key holding the token size of that stored conversation, as
+# reported by the last response's usage; the server replays all of it per turn.
+CONTEXT_TOKENS_KEY = "last_context_tokens"
+
+# Token budget for the conversation input. A stored conversation that has grown
+# past it is dropped and the trimmed history is resent, oldest messages first out.
+MAX_CTX_TOKENS = 4000
+
+# Answers to tool-free requests are reused for identical conversations.
+RESPONSE_CACHE_SIZE = 256
+RESPONSE_CACHE_TTL = 3600.0  # seconds
+RESPONSE_CACHE_PATH = Path(".cache") / "responses"
+
+_SYSTEM_PROMPT = "You are a helpful assistant for a structural engineering application called Anthill. You can help users with questions about structural analysis, embodied carbon calculations, and interpreting 3D mesh models. Be concise and technical when appropriate."
+_SYSTEM_MSG = {"role": "system", "content": _SYSTEM_PROMPT}
+
+_ORJSON_OPTIONS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+)
+
+_DURATION_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+class _TokenBucket:
+    """Thread-safe token bucket refilled continuously at `rate_per_minute`."""
+
+    def __init__(self, rate_per_minute: float):
+        self.capacity = float(rate_per_minute)
+        self.tokens = self.capacity
+        self.fill_rate = rate_per_minute / 60.0
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, amount: float = 1.0) -> None:
+        """Block until `amount` tokens are available, then consume them."""
+        amount = min(amount, self.capacity)
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.fill_rate)
+                self.updated = now
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return
+                wait = (amount - self.tokens) / self.fill_rate
+            time.sleep(wait)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_openai_client(api_key: str) -> openai.OpenAI:
+    """Return a shared OpenAI client for `api_key`.
+
+    Streamlit rebuilds MCPClient on every rerun; sharing the client keeps its
+    connection pool (and TLS sessions) alive between chat turns.
+    """
+    http_client = httpx.Client(
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16, keepalive_expiry=30.0),
+        timeout=httpx.Timeout(60.0, connect=5.0),
+    )
+    return openai.OpenAI(api_key=api_key, http_client=http_client)
+
+
+_request_bucket = _TokenBucket(REQUESTS_PER_MINUTE)
+_token_bucket = _TokenBucket(TOKENS_PER_MINUTE)
+
+
+class _ResponseCache:
+    """Bounded LRU of answers with a TTL, persisted with shelve across sessions."""
+
+    def __init__(self, path: Path, maxsize: int, ttl: float):
+        self.path = path
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def _load(self) -> None:
+        try:
+            with shelve.open(str(self.path), flag="r") as db:
+                stored = sorted(db.items(), key=lambda item: item[1][0])
+        except Exception:
+            stored = []
+        now = time.time()
+        for key, entry in stored[-self.maxsize:]:
+            if now - entry[0] < self.ttl:
+                self._entries[key] = entry
+        self._loaded = True
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.time() - entry[0] >= self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: str, text: str) -> None:
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            entry = (time.time(), text)
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            evicted = []
+            while len(self._entries) > self.maxsize:
+                evicted.append(self._entries.popitem(last=False)[0])
+            try:
+                self.path.parent.mkdir(exist_ok=True)
+                with shelve.open(str(self.path), flag="c") as db:
+                    db[key] = entry
+                    for old_key in evicted:
+                        db.pop(old_key, None)
+            except Exception:
+                pass  # persistence is best effort; the in-memory cache still works
+
+
+_response_cache = _ResponseCache(RESPONSE_CACHE_PATH, RESPONSE_CACHE_SIZE, RESPONSE_CACHE_TTL)
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize tool/scene payloads to indented JSON bytes.
+
+    Unsupported types are converted with str(); NumPy arrays serialize natively.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, default=str, option=_ORJSON_OPTIONS)
+        except TypeError:
+            # e.g. integers wider than 64 bits, which orjson rejects
+            pass
+    return json.dumps(data, indent=2, default=_json_default).encode("utf-8")
+
+
+def _json_default(value: Any) -> Any:
+    # NumPy arrays and scalars expose tolist(); everything else becomes a string
+    tolist = getattr(value, "tolist", None)
+    return tolist() if callable(tolist) else str(value)
+
+
+def _to_response_tool(tool: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a chat-completions tool schema to the Responses API format."""
+    function = tool["function"]
+    return {
+        "type": "function",
+        "name": function["name"],
+        "description": function.get("description", ""),
+        "parameters": function.get("parameters", {}),
+        "strict": False,
+    }
+
+
+def _without_tools(request: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: v for k, v in request.items() if k not in ("tools", "tool_choice")}
+
+
+# Scene files are written by a single background thread so the follow-up
+# OpenAI request does not wait on disk I/O.
+_scene_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scene-writer")
+_scene_write_lock = threading.Lock()
+_pending_scene_write: Optional[Future] = None
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    with _scene_write_lock:
+        # The file is shared by every session, so compare against what is on
+        # disk; identical content keeps its mtime and skips the rewrite
+        try:
+            if path.stat().st_size == len(data) and path.read_bytes() == data:
+                return
+        except OSError:
+            pass
+        # Write beside the target and swap it in so the viewer never reads a partial file
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+
+def _queue_scene_write(path: Path, data: bytes) -> None:
+    global _pending_scene_write
+    _pending_scene_write = _scene_writer.submit(_atomic_write, path, data)
+
+
+def flush_scene_writes(timeout: Optional[float] = None) -> None:
+    """Wait for the most recently queued scene write to finish.
+
+    Call before reading a generated scene file. Write failures are logged
+    rather than raised, leaving the previous file in place.
+    """
+    global _pending_scene_write
+    pending = _pending_scene_write
+    if pending is None:
+        return
+    try:
+        pending.result(timeout)
+    except Exception as e:
+        if not pending.done():
+            return  # timed out; the write is still running
+        logger.error("Failed to write scene file: %s", e)
+    # Report a failure once, not on every rerun; a newer queued write is kept
+    if _pending_scene_write is pending:
+        _pending_scene_write = None
+
+
+def _scene_payload(result: Any) -> Optional[Any]:
+    """Extract the scene JSON a tool result carries, if any."""
+    if not isinstance(result, dict):
+        return None
+    if isinstance(result.get("scene"), (dict, list)):
+        return result["scene"]
+    if "StructuralFrame" in result:
+        return {"StructuralFrame": result["StructuralFrame"]}
+    return None
+
+
+def _parse_total(value: Any) -> Optional[float]:
+    """Coerce a tool's carbon total (often a numeric string) to float, or None."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _response_cache_key(model: str, messages: List[Dict[str, Any]]) -> str:
+    payload = json.dumps(messages, sort_keys=True, ensure_ascii=False)
+    return f"{model}:{hashlib.sha256(payload.encode('utf-8')).hexdigest()}"
+
+
+@functools.lru_cache(maxsize=1)
+def _get_encoding():
+    """Return the gpt-4o-mini tokenizer, or None if tiktoken is unavailable."""
+    try:
+        import tiktoken
+        return tiktoken.encoding_for_model("gpt-4o-mini")
+    except Exception:
+        return None
+
+
+def _count_tokens(text: str) -> int:
+    encoding = _get_encoding()
+    if encoding is None:
+        return len(text) // 4  # rough average for English text
+    return len(encoding.encode(text))
+
+
+@functools.lru_cache(maxsize=256)
+def _message_tokens(content: str) -> int:
+    """Token length of a chat message; memoized so each turn only tokenizes new messages."""
+    return 4 + _count_tokens(content)  # 4 = per-message framing
+
+
+def _trim_history(history: List[Dict[str, Any]], budget: int) -> List[Dict[str, Any]]:
+    """Return the most recent user/assistant messages that fit in `budget` tokens."""
+    kept: List[Dict[str, Any]] = []
+    for msg in reversed(history):
+        if msg["role"] not in ("user", "assistant"):
+            continue
+        budget -= _message_tokens(msg["content"])
+        if budget < 0:
+            break
+        kept.append({"role": msg["role"], "content": msg["content"]})
+    kept.reverse()
+    return kept
+
+
+def _estimate_tokens(items: List[Dict[str, Any]], max_tokens: int = 0, instructions: str = "") -> int:
+    """Estimate the tokens a request counts against the per-minute limit."""
+    total = max_tokens + _count_tokens(instructions)
+    for item in items:
+        text = item.get("content") or item.get("output") or ""
+        total += 4 + _count_tokens(text)  # 4 = per-message framing
+    return total
+
+
+def _estimate_request_tokens(request: Dict[str, Any]) -> int:
+    return _estimate_tokens(
+        request.get("input", []),
+        request.get("max_output_tokens", 0),
+        request.get("instructions") or "",
+    )
+
+
+def _context_tokens(response: Any) -> int:
+    """Tokens a continuation of `response` replays: its input plus its output."""
+    usage = getattr(response, "usage", None)
+    return (getattr(usage, "total_tokens", None) or 0) if usage is not None else 0
+
+
+def _reset_conversation() -> None:
+    st.session_state.pop(LAST_RESPONSE_KEY, None)
+    st.session_state.pop(CONTEXT_TOKENS_KEY, None)
+
+
+def _parse_duration(value: Optional[str]) -> Optional[float]:
+    """Parse rate-limit reset values such as '1s', '6m0s' or '20ms'."""
+    if not value:
+        return None
+    parts = _DURATION_RE.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
+
+
+def _retry_delay(error: openai.RateLimitError, attempt: int) -> float:
+    """Seconds to wait before retrying, honoring the server's hints."""
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    delay = None
+    try:
+        if headers.get("retry-after-ms"):
+            delay = float(headers["retry-after-ms"]) / 1000.0
+        elif headers.get("retry-after"):
+            delay = float(headers["retry-after"])
+    except ValueError:
+        delay = None
+    if delay is None:
+        resets = [
+            _parse_duration(headers.get(name))
+            for name in ("x-ratelimit-reset-requests", "x-ratelimit-reset-tokens")
+        ]
+        resets = [r for r in resets if r is not None]
+        delay = max(resets) if resets else min(2.0 ** attempt, 30.0)
+    return delay + random.uniform(0.05, 0.25)
+
 
 class MCPClient:
     """OpenAI GPT client for chat functionality.
@@ -26,6 +388,7 @@ class MCPClient:
         self._connected = False
         self.grasshopper_client = DirectGrasshopperClient()
         self.mcp_tools_available = self.grasshopper_client.available
+        self._tools_cache: Optional[List[Dict[str, Any]]] = None
         
         if api_key:
             self.connect()
@@ -36,7 +399,7 @@ class MCPClient:
             raise ValueError("API key is required to connect to OpenAI")
         
         try:
-            self.client = openai.OpenAI(api_key=self.api_key)
+            self.client = _get_openai_client(self.api_key)
             self._connected = True
         except Exception as e:
             self._connected = False
@@ -45,6 +408,18 @@ class MCPClient:
     def is_connected(self) -> bool:
         return self._connected and self.client is not None
 
+    @property
+    def tools(self) -> List[Dict[str, Any]]:
+        """Grasshopper tool schemas, fetched once and reused until invalidated."""
+        if self._tools_cache is None and self.mcp_tools_available:
+            self._tools_cache = self.grasshopper_client.get_available_tools()
+        return self._tools_cache or []
+
+    def invalidate_tools(self):
+        """Drop the cached tool schemas, e.g. after Grasshopper reconnects."""
+        self._tools_cache = None
+        self.mcp_tools_available = self.grasshopper_client.available
+
     def send_message(self, prompt: str, conversation_history: Optional[List[Dict[str, str]]] = None) -> str:
         """Send a message to GPT and return the response.
 
@@ -60,6 +435,63 @@ class MCPClient:
         str
             GPT's response to the prompt.
         """
+        return "".join(self.stream_message(prompt, conversation_history))
+
+    def stream_message(self, prompt: str, conversation_history: Optional[List[Dict[str, str]]] = None) -> Iterator[str]:
+        """Send a message to GPT and yield the response text as it arrives.
+
+        The conversation is continued server-side via the Responses API's
+        `previous_response_id`, so normally only the new prompt is sent; the
+        (trimmed) history is resent when no stored response is available or
+        the stored conversation has outgrown MAX_CTX_TOKENS.
+        Tool calls are executed and the follow-up response is streamed the
+        same way. Errors are yielded as text so the UI can render them in
+        place of the answer.
+        """
+        error = self._ensure_connected()
+        if error is not None:
+            yield error
+            return
+
+        try:
+            request, messages, cache_key = self._prepare_turn(prompt, conversation_history)
+            if cache_key is not None:
+                cached = _response_cache.get(cache_key)
+                if cached is not None:
+                    # The server-side conversation lacks this turn; resend history next time
+                    _reset_conversation()
+                    yield cached
+                    return
+
+            stream = self._create_continued(dict(request, stream=True), [messages[-1]], messages)
+
+            text_parts: List[str] = []
+            response = yield from self._stream_text(stream, text_parts)
+
+            # Incomplete answers (e.g. cut off at max_output_tokens) must not be replayed to others
+            if cache_key is not None and text_parts and response.status == "completed":
+                _response_cache.put(cache_key, "".join(text_parts))
+
+            # Handle function calls
+            tool_calls = [item for item in response.output if item.type == "function_call"]
+            if tool_calls:
+                if text_parts:
+                    yield "\n\n"
+                response = yield from self._handle_tool_calls(tool_calls, response, _without_tools(request))
+
+            if response is not None:
+                st.session_state[LAST_RESPONSE_KEY] = response.id
+                st.session_state[CONTEXT_TOKENS_KEY] = _context_tokens(response)
+
+        except openai.AuthenticationError:
+            yield "❌ Authentication failed. Please check your OpenAI API key."
+        except openai.RateLimitError:
+            yield "⏳ Rate limit exceeded. Please wait a moment and try again."
+        except Exception as e:
+            yield f"⚠️ Error communicating with GPT: {str(e)}"
+
+    def _ensure_connected(self) -> Optional[str]:
+        """Connect if needed; return a user-facing message if that is not possible."""
         # Debug information
         if not self.api_key:
             return "🔍 Debug: No API key provided to MCPClient"
@@ -72,127 +504,188 @@ class MCPClient:
                     return f"🔍 Debug: Failed to connect - {str(e)}"
             else:
                 return "⚠️ Please configure your OpenAI API key to chat with GPT."
+        return None
 
-        try:
-            # Prepare messages for GPT
-            messages = [
-                {
-                    "role": "system",
-                    "content": "You are a helpful assistant for a structural engineering application called Anthill. You can help users with questions about structural analysis, embodied carbon calculations, and interpreting 3D mesh models. Be concise and technical when appropriate."
-                }
-            ]
-            
-            # Add conversation history (skip system messages, only user/assistant)
-            if conversation_history:
-                for msg in conversation_history[-10:]:  # Keep last 10 messages for context
-                    if msg["role"] in ["user", "assistant"]:
-                        messages.append({
-                            "role": msg["role"],
-                            "content": msg["content"]
-                        })
-            
-            # Add current prompt
-            messages.append({
-                "role": "user", 
-                "content": prompt
-            })
+    def _prepare_turn(
+        self,
+        prompt: str,
+        conversation_history: Optional[List[Dict[str, str]]],
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]], Optional[str]]:
+        """Build the request options, full conversation input and cache key for a turn.
 
-            # Get available MCP tools for function calling
-            tools = []
-            if self.mcp_tools_available:
-                tools = self.grasshopper_client.get_available_tools()
-            
-            # Call OpenAI API with or without tools
-            if tools:
-                response = self.client.chat.completions.create(
-                    model="gpt-4o-mini",
-                    messages=messages,
-                    tools=tools,
-                    tool_choice="auto",
-                    max_tokens=1500,
-                    temperature=0.7
-                )
-            else:
-                response = self.client.chat.completions.create(
-                    model="gpt-4o-mini",
-                    messages=messages,
-                    max_tokens=1500,
-                    temperature=0.7
+        The conversation ends with the new prompt; it is sent in full only
+        when there is no stored response to continue from. The cache key is
+        None when tools are offered, since tool calls have side effects.
+        """
+        # Add current prompt
+        prompt_message = {
+            "role": "user", 
+            "content": prompt
+        }
+
+        # Full conversation, sent only when there is no stored response to continue from.
+        # History (skip system messages, only user/assistant) fills what the prompt leaves of the budget.
+        budget = MAX_CTX_TOKENS - 4 - _count_tokens(prompt)
+        messages = _trim_history(conversation_history or [], budget)
+        messages.append(prompt_message)
+
+        request: Dict[str, Any] = dict(
+            model="gpt-4o-mini",
+            instructions=_SYSTEM_PROMPT,
+            max_output_tokens=1500,
+            temperature=0.7,
+        )
+
+        # Get available MCP tools for function calling
+        tools = [_to_response_tool(tool) for tool in self.tools]
+        if tools:
+            request.update(tools=tools, tool_choice="auto")
+            cache_key = None
+        else:
+            # Tool calls have side effects (scene output), so only tool-free answers are cached
+            cache_key = _response_cache_key("gpt-4o-mini", [_SYSTEM_MSG, *messages])
+
+        return request, messages, cache_key
+
+    def _create_continued(
+        self,
+        request: Dict[str, Any],
+        new_input: List[Dict[str, Any]],
+        full_input: List[Dict[str, Any]],
+    ) -> Any:
+        """Continue the stored conversation, or start over with `full_input`.
+
+        The stored conversation is abandoned once it outgrows MAX_CTX_TOKENS,
+        since the server would replay all of it on every turn.
+        """
+        previous_response_id = st.session_state.get(LAST_RESPONSE_KEY)
+        context_tokens = st.session_state.get(CONTEXT_TOKENS_KEY, 0)
+        if previous_response_id and context_tokens <= MAX_CTX_TOKENS:
+            try:
+                return self._rate_limited_create(
+                    context_tokens, input=new_input, previous_response_id=previous_response_id, **request
                 )
-            
-            # Handle function calls
-            message = response.choices[0].message
-            
-            if message.tool_calls:
-                return self._handle_tool_calls(message, messages)
-            else:
-                return message.content
+            except (openai.NotFoundError, openai.BadRequestError):
+                # Stored response expired, was deleted, or is otherwise unusable
+                pass
+        _reset_conversation()
+        return self._rate_limited_create(input=full_input, **request)
 
-        except openai.AuthenticationError:
-            return "❌ Authentication failed. Please check your OpenAI API key."
-        except openai.RateLimitError:
-            return "⏳ Rate limit exceeded. Please wait a moment and try again."
-        except Exception as e:
-            return f"⚠️ Error communicating with GPT: {str(e)}"
+    def _stream_text(self, stream: Any, text_parts: Optional[List[str]] = None) -> Generator[str, None, Any]:
+        """Yield output text deltas from a response stream; return the final response."""
+        final_response = None
+        for event in stream:
+            if event.type == "response.output_text.delta":
+                if text_parts is not None:
+                    text_parts.append(event.delta)
+                yield event.delta
+            elif event.type in ("response.completed", "response.incomplete"):
+                final_response = event.response
+            elif event.type == "response.failed":
+                error = event.response.error
+                raise RuntimeError(error.message if error else "Response failed")
+            elif event.type == "error":
+                raise RuntimeError(event.message)
+        if final_response is None:
+            raise RuntimeError("Response stream ended before completion")
+        return final_response
 
-    def _handle_tool_calls(self, message, messages: List[Dict[str, Any]]) -> str:
-        """Handle OpenAI function calls by executing them via MCP."""
+    def _handle_tool_calls(
+        self,
+        tool_calls: List[Any],
+        response: Any,
+        request: Dict[str, Any],
+    ) -> Generator[str, None, Any]:
+        """Handle OpenAI function calls by executing them via MCP.
+
+        Streams the follow-up response text and returns the final response,
+        or None if handling failed.
+        """
         try:
-            # Add the assistant message with tool calls
-            messages.append({
-                "role": "assistant",
-                "content": message.content,
-                "tool_calls": [
-                    {
-                        "id": tc.id,
-                        "type": tc.type,
-                        "function": {"name": tc.function.name, "arguments": tc.function.arguments}
-                    } for tc in message.tool_calls
-                ]
-            })
-            
-            # Execute each tool call
-            for tool_call in message.tool_calls:
-                function_name = tool_call.function.name
-                arguments = json.loads(tool_call.function.arguments)
-                
-                try:
-                    # Call the MCP tool
-                    result = self.grasshopper_client.call_tool(function_name, arguments)
-                    print('result', result)
-
-                    # Persist scene output for visualization if available
-                    self._register_scene_result(result)
-
-                    # Add tool result to messages
-                    tool_content = self._format_tool_content(result)
-                    messages.append({
-                        "role": "tool",
-                        "tool_call_id": tool_call.id,
-                        "content": tool_content
-                    })
-                    
-                except Exception as e:
-                    # Add error result
-                    messages.append({
-                        "role": "tool", 
-                        "tool_call_id": tool_call.id,
-                        "content": f"Error executing {function_name}: {str(e)}"
-                    })
-            
-            # Get final response from OpenAI with tool results
-            final_response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=messages,
-                max_tokens=1500,
-                temperature=0.7
+            # Execute the tool calls concurrently so their round-trips overlap
+            with ThreadPoolExecutor(max_workers=min(8, len(tool_calls))) as executor:
+                futures = [executor.submit(self._call_tool, tool_call) for tool_call in tool_calls]
+            results = [future.exception() or future.result() for future in futures]
+
+            # Stream final response from OpenAI with tool results
+            final_stream = self._rate_limited_create(
+                _context_tokens(response),
+                input=self._tool_outputs(tool_calls, results),
+                previous_response_id=response.id,
+                stream=True,
+                **request
             )
-            
-            return final_response.choices[0].message.content
+            return (yield from self._stream_text(final_stream))
             
         except Exception as e:
-            return f"⚠️ Error handling tool calls: {str(e)}"
+            yield f"⚠️ Error handling tool calls: {str(e)}"
+            return None
     
+    def _call_tool(self, tool_call: Any) -> Any:
+        """Call the MCP tool named by an OpenAI function call."""
+        arguments = json.loads(tool_call.arguments)
+        return self.grasshopper_client.call_tool(tool_call.name, arguments)
+
+    def _tool_outputs(self, tool_calls: List[Any], results: List[Any]) -> List[Dict[str, Any]]:
+        """Turn tool results (or the exceptions they raised) into function_call_output items.
+
+        Runs on the calling thread, in call order, since _register_scene_results
+        touches Streamlit session state.
+        """
+        tool_outputs: List[Dict[str, Any]] = []
+        scene_results: List[Any] = []
+        for tool_call, result in zip(tool_calls, results):
+            function_name = tool_call.name
+            
+            try:
+                if isinstance(result, Exception):
+                    raise result
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Tool %s result: %r", function_name, result)
+
+                # Add tool result to the follow-up input
+                tool_content = self._format_tool_content(result)
+                scene_results.append(result)
+                
+            except Exception as e:
+                # Add error result
+                tool_content = f"Error executing {function_name}: {str(e)}"
+
+            tool_outputs.append({
+                "type": "function_call_output",
+                "call_id": tool_call.call_id,
+                "output": tool_content
+            })
+
+        # Persist the turn's scene output for visualization, if any
+        try:
+            self._register_scene_results(scene_results)
+        except Exception as e:
+            # The model still needs the tool outputs even if the viewer update fails
+            logger.error(f"Failed to register scene results: {e}")
+        return tool_outputs
+
+    def _rate_limited_create(self, context_tokens: int = 0, **kwargs: Any) -> Any:
+        """Call responses.create under the shared rate limits.
+
+        Requests are paced by the request/token buckets and retried with
+        jittered backoff on 429s, up to MAX_RATE_LIMIT_RETRIES times.
+        `context_tokens` is the size of the stored conversation the server
+        replays for a `previous_response_id` request, which counts against
+        the token limit too.
+        """
+        estimated_tokens = _estimate_request_tokens(kwargs) + context_tokens
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            _request_bucket.acquire()
+            _token_bucket.acquire(estimated_tokens)
+            try:
+                return self.client.responses.create(**kwargs)
+            except openai.RateLimitError as e:
+                # An exhausted quota will not recover by waiting
+                if attempt == MAX_RATE_LIMIT_RETRIES or getattr(e, "code", None) == "insufficient_quota":
+                    raise
+                time.sleep(_retry_delay(e, attempt))
+
     def update_api_key(self, api_key: str):
         """Update the API key and reconnect."""
         self.api_key = api_key
@@ -201,41 +694,32 @@ class MCPClient:
         if api_key:
             self.connect()
 
-    def _register_scene_result(self, result: Any) -> None:
-        if not isinstance(result, dict):
-            return
+    def _register_scene_results(self, results: List[Any]) -> None:
+        """Write the turn's latest scene payload for the viewer.
 
-        scene_data = None
-        if isinstance(result.get("scene"), (dict, list)):
-            scene_data = result["scene"]
-        elif "StructuralFrame" in result:
-            scene_data = {"StructuralFrame": result["StructuralFrame"]}
-
-        if scene_data is None:
+        Several compute calls in one turn are alternative designs rather than
+        parts of one building, so the last payload wins along with its total.
+        """
+        scenes = [(result, payload) for result in results if (payload := _scene_payload(result)) is not None]
+        if not scenes:
             return
 
+        result, scene_data = scenes[-1]
         cache_dir = Path(".cache")
         cache_dir.mkdir(exist_ok=True)
         scene_path = cache_dir / "compute_scene.json"
-        try:
-            scene_path.write_text(json.dumps(scene_data, indent=2), encoding="utf-8")
-        except TypeError:
-            # Fallback to serializer that converts unsupported types to strings
-            scene_path.write_text(
-                json.dumps(scene_data, indent=2, default=str),
-                encoding="utf-8",
-            )
+        _queue_scene_write(scene_path, _dumps(scene_data))
 
         st.session_state["generated_scene_path"] = str(scene_path)
         st.session_state["generated_scene_label"] = "Grasshopper MCP"
-        if "totalCarbonEmission" in result:
-            st.session_state["generated_scene_total"] = result["totalCarbonEmission"]
+        total = _parse_total(result.get("totalCarbonEmission"))
+        if total is not None:
+            st.session_state["generated_scene_total"] = total
+        else:
+            st.session_state.pop("generated_scene_total", None)
         st.session_state["scene_ready"] = True
 
     def _format_tool_content(self, result: Any) -> str:
         if isinstance(result, (dict, list)):
-            try:
-                return json.dumps(result, indent=2)
-            except TypeError:
-                return json.dumps(result, default=str)
+            return _dumps(result).decode("utf-8")
         return str(result)
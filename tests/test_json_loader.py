@@ -0,0 +1,145 @@
+import io
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from utils import _mesh_numba  # noqa: E402
+from utils._mesh_numba import _decode_uniform_faces, decode_faces  # noqa: E402
+from utils.json_loader import (  # noqa: E402
+	MeshParseError,
+	_parse_geometry,
+	_parse_linear_elements,
+	_parse_slab_system,
+	iter_structural_frame,
+	load_scene_streaming,
+	parse_point_string,
+	parse_point_strings,
+)
+
+
+def test_parse_point_strings_rejects_mixed_arity():
+	# Total count is 6 = 2 * 3, but neither point has 3 coordinates.
+	with pytest.raises(MeshParseError):
+		parse_point_strings(["{1, 2}", "{3, 4, 5, 6}"])
+
+
+@pytest.mark.parametrize("point", [5, None, [1, 2, 3]])
+def test_non_string_point_is_parse_error(point):
+	with pytest.raises(MeshParseError):
+		parse_point_string(point)
+	with pytest.raises(MeshParseError):
+		parse_point_strings(["{0, 0, 0}", point])
+
+
+def test_linear_elements_mixed_arity_names_bad_point():
+	system = {"elements": [{"PointStart": "{1, 2}", "PointEnd": "{3, 4, 5, 6}"}]}
+	with pytest.raises(MeshParseError, match=r"\{1, 2\}"):
+		_parse_linear_elements(system, "Beam", "Beam")
+
+
+def test_slab_mixed_arity_names_bad_point():
+	system = {"elements": [{"Point1": "{0,0}", "Point2": "{1,0,0,0}"}]}
+	with pytest.raises(MeshParseError, match=r"\{0,0\}"):
+		_parse_slab_system(system)
+
+
+def test_linear_elements_batch_parse():
+	system = {"elements": [
+		{"PointStart": "{0, 0, 0}", "PointEnd": "{1, 2, 3}"},
+		{"PointStart": "{-1.5, 2e1, 3}", "PointEnd": "{4, 5, 6}"},
+	]}
+	beams, _ = _parse_linear_elements(system, "Beam", "Beam")
+	assert [tuple(b.end_point) for b in beams] == [(1.0, 2.0, 3.0), (4.0, 5.0, 6.0)]
+	assert tuple(beams[1].start_point) == (-1.5, 20.0, 3.0)
+
+
+def test_geometry_out_of_range_face_index_is_parse_error():
+	geometry = {"uuid": "g", "data": {"vertices": [0, 0, 0] * 3, "faces": [0, 0, 1, 2 ** 40]}}
+	with pytest.raises(MeshParseError):
+		_parse_geometry(geometry, "g")
+
+
+@pytest.mark.parametrize("frame", [
+	[{"BeamSystem": []}, {"TotalCO2": 3}],
+	{"BeamSystem": [], "TotalCO2": 3},
+])
+def test_iter_structural_frame_variants(frame):
+	pytest.importorskip("ijson")
+	fp = io.BytesIO(json.dumps({"StructuralFrame": frame}).encode())
+	assert [key for key, _ in iter_structural_frame(fp)] == ["BeamSystem", "TotalCO2"]
+
+
+def test_iter_structural_frame_without_frame():
+	pytest.importorskip("ijson")
+	fp = io.BytesIO(json.dumps({"geometries": [], "object": {"StructuralFrame": {}}}).encode())
+	assert list(iter_structural_frame(fp)) == []
+
+
+def test_load_scene_streaming_detects_format(tmp_path):
+	pytest.importorskip("ijson")
+	threejs = tmp_path / "scene.json"
+	threejs.write_text(json.dumps({
+		"metadata": {"version": 4.3},
+		"geometries": [{"uuid": "g1", "data": {"vertices": [0, 0, 0, 1, 0, 0, 0, 1, 0], "faces": [0, 0, 1, 2]}}],
+		"object": {"children": [{"type": "Mesh", "geometry": "g1", "name": "Slab A"}]},
+	}))
+	scene = load_scene_streaming(threejs)
+	assert [m.name for m in scene.meshes] == ["Slab A"]
+
+	frame = tmp_path / "frame.json"
+	frame.write_text(json.dumps({"StructuralFrame": {"TotalCO2": "12.5"}}))
+	scene = load_scene_streaming(frame)
+	assert not scene.meshes and scene.metadata["totalCO2"] == 12.5
+
+
+# Triangle then quad, each with material (bit 1), face UV (bit 2) and vertex UV (bit 3)
+# indices for two UV layers: 1 + 3 + 1 + 2 + 2 * 3 = 13 and 1 + 4 + 1 + 2 + 2 * 4 = 16 entries.
+_UV_FACES = [14, 0, 1, 2, 9, 8, 8, 7, 7, 7, 7, 7, 7] + [15, 3, 4, 5, 6, 9, 8, 8, 7, 7, 7, 7, 7, 7, 7, 7]
+
+
+@pytest.fixture(params=["jit", "python"])
+def face_decoder(request, monkeypatch):
+	if request.param == "python":
+		monkeypatch.setattr(_mesh_numba, "_decode_bitmask_faces_jit", None)
+	elif _mesh_numba._decode_bitmask_faces_jit is None:
+		pytest.skip("numba is not installed")
+	return decode_faces
+
+
+def test_decode_quads_split_like_threejs(face_decoder):
+	faces = face_decoder(np.array([1, 0, 1, 2, 3, 1, 4, 5, 6, 7]))
+	assert faces.tolist() == [[0, 1, 3], [1, 2, 3], [4, 5, 7], [5, 6, 7]]
+
+
+def test_decode_mixed_records_sequentially(face_decoder):
+	raw = np.array([0, 0, 1, 2, 1, 3, 4, 5, 6, 0, 7, 8, 9])
+	assert _decode_uniform_faces(raw, 0) is None
+	assert face_decoder(raw).tolist() == [[0, 1, 2], [3, 4, 6], [4, 5, 6], [7, 8, 9]]
+
+
+def test_decode_uv_record_sizes(face_decoder):
+	faces = face_decoder(np.array(_UV_FACES), n_uv_layers=2)
+	assert faces.tolist() == [[0, 1, 2], [3, 4, 6], [4, 5, 6]]
+	uniform = face_decoder(np.array(_UV_FACES[:13] * 2), n_uv_layers=2)
+	assert uniform.tolist() == [[0, 1, 2], [0, 1, 2]]
+
+
+def test_decode_paths_agree(monkeypatch):
+	raw = np.array(_UV_FACES * 3)
+	jit_faces = decode_faces(raw, 2)
+	monkeypatch.setattr(_mesh_numba, "_decode_bitmask_faces_jit", None)
+	python_faces = decode_faces(raw, 2)
+	assert python_faces.dtype == jit_faces.dtype
+	assert np.array_equal(python_faces, jit_faces)
+
+
+@pytest.mark.parametrize("faces", [[0, 0, 1], [1, 0, 1, 2], [0, 0, 1, 2, 1, 0, 1, 2]])
+def test_truncated_face_record_is_parse_error(face_decoder, faces):
+	geometry = {"uuid": "g", "data": {"vertices": [0, 0, 0] * 4, "faces": faces}}
+	with pytest.raises(MeshParseError):
+		_parse_geometry(geometry, "g")
@@ -0,0 +1,38 @@
+import math
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from models.mesh import BeamGeometry, MeshScene, SlabGeometry, Vertex  # noqa: E402
+
+
+def test_aggregate_bounds_keep_beam_coordinates_exact():
+	beam = BeamGeometry("B1", Vertex(0.1, 0.1, 0.1), Vertex(1.3, 2.7, 0.1))
+	mn, mx = MeshScene(beams=[beam]).aggregate_bounds()
+	assert mn == (0.1, 0.1, 0.1)
+	assert mx == (1.3, 2.7, 0.1)
+
+
+def _slab(*corners):
+	return SlabGeometry("S1", [Vertex(*c) for c in corners])
+
+
+def test_concave_slab_area_is_polygon_area():
+	# 4 x 4 square with a triangular notch (area 6) cut into the top edge.
+	slab = _slab((0, 0, 0), (4, 0, 0), (4, 4, 0), (2, 1, 0), (0, 4, 0))
+	assert slab.area() == pytest.approx(10.0)
+
+
+def test_non_planar_slab_sums_fan_triangles():
+	slab = _slab((0, 0, 0), (1, 0, 0), (1, 1, 1), (0, 1, 0))
+	assert slab.area() == pytest.approx(math.sqrt(2))
+
+
+def test_slab_with_collinear_leading_corners():
+	rect = _slab((0, 0, 0), (1, 0, 0), (2, 0, 0), (2, 2, 0), (0, 2, 0))
+	assert rect.area() == pytest.approx(4.0)
+	concave = _slab((0, 0, 0), (2, 0, 0), (4, 0, 0), (4, 4, 0), (2, 1, 0), (0, 4, 0))
+	assert concave.area() == pytest.approx(10.0)
@@ -0,0 +1,138 @@
+"""Three.js face-array decoding, JIT-compiled with numba when installed, and index validation.
+
+Each face record in a Three.js (JSON format 3) `faces` array starts with a
+bitmask describing what follows the vertex indices:
+
+	bit 0: quad (4 vertex indices) instead of triangle (3)
+	bit 1: material index
+	bit 2: face UV index per UV layer
+	bit 3: vertex UV indices per UV layer
+	bit 4: face normal index
+	bit 5: vertex normal indices
+	bit 6: face color index
+	bit 7: vertex color indices
+
+Only the triangle indices are kept; quads are split into two triangles the
+same way the Three.js loader does.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+	from numba import njit
+except ImportError:  # pragma: no cover - optional dependency
+	njit = None
+
+
+def _record_size(flags: int, nverts: int, n_uv_layers: int) -> int:
+	size = 1 + nverts
+	if flags & 2:
+		size += 1
+	if flags & 4:
+		size += n_uv_layers
+	if flags & 8:
+		size += n_uv_layers * nverts
+	if flags & 16:
+		size += 1
+	if flags & 32:
+		size += nverts
+	if flags & 64:
+		size += 1
+	if flags & 128:
+		size += nverts
+	return size
+
+
+def _decode_bitmask_faces(raw, n_uv_layers):
+	n = len(raw)
+
+	# First pass: validate records and count output triangles
+	pos = 0
+	n_tris = 0
+	while pos < n:
+		flags = raw[pos]
+		if flags < 0 or flags > 255:
+			raise ValueError("invalid face flags")
+		nverts = 4 if flags & 1 else 3
+		size = _record_size(flags, nverts, n_uv_layers)
+		if pos + size > n:
+			raise ValueError("truncated face record")
+		n_tris += nverts - 2
+		pos += size
+
+	# Second pass: copy vertex indices into a contiguous triangle array
+	triangles = np.empty((n_tris, 3), dtype=np.int32)
+	pos = 0
+	t = 0
+	while pos < n:
+		flags = raw[pos]
+		if flags & 1:
+			a, b, c, d = raw[pos + 1], raw[pos + 2], raw[pos + 3], raw[pos + 4]
+			triangles[t, 0], triangles[t, 1], triangles[t, 2] = a, b, d
+			triangles[t + 1, 0], triangles[t + 1, 1], triangles[t + 1, 2] = b, c, d
+			t += 2
+			pos += _record_size(flags, 4, n_uv_layers)
+		else:
+			triangles[t, 0], triangles[t, 1], triangles[t, 2] = raw[pos + 1], raw[pos + 2], raw[pos + 3]
+			t += 1
+			pos += _record_size(flags, 3, n_uv_layers)
+	return triangles
+
+
+if njit is not None:
+	_record_size = njit(cache=True)(_record_size)
+	_decode_bitmask_faces_jit = njit(cache=True)(_decode_bitmask_faces)
+else:
+	_decode_bitmask_faces_jit = None
+
+
+def _decode_uniform_faces(raw: np.ndarray, n_uv_layers: int) -> np.ndarray | None:
+	"""Reshape-based decode when every record has the same flags, else None.
+
+	Exporters usually write one record layout per mesh (plain triangles with
+	a 0 flag being the common case), which makes the records fixed-size rows.
+	"""
+	flags = int(raw[0])
+	if flags < 0 or flags > 255:
+		return None
+	nverts = 4 if flags & 1 else 3
+	size = _record_size(flags, nverts, n_uv_layers)
+	if raw.size % size != 0:
+		return None
+	records = raw.reshape(-1, size)
+	if not (records[:, 0] == flags).all():
+		return None
+	# Copy so the triangles own a compact buffer instead of viewing the record rows
+	if nverts == 3:
+		return np.ascontiguousarray(records[:, 1:4], dtype=np.int32)
+	triangles = np.empty((2 * records.shape[0], 3), dtype=np.int32)
+	triangles[0::2] = records[:, [1, 2, 4]]
+	triangles[1::2] = records[:, [2, 3, 4]]
+	return triangles
+
+
+def decode_faces(raw: np.ndarray, n_uv_layers: int = 0) -> np.ndarray:
+	"""Decode a flat Three.js faces array into an (M, 3) int32 triangle array.
+
+	Raises ValueError on unknown flags or a truncated record.
+	"""
+	if raw.ndim != 1:
+		raise ValueError("faces must be a flat list")
+	if raw.size == 0:
+		return np.empty((0, 3), dtype=np.int32)
+	triangles = _decode_uniform_faces(raw, n_uv_layers)
+	if triangles is not None:
+		return triangles
+	if _decode_bitmask_faces_jit is not None:
+		return _decode_bitmask_faces_jit(raw.astype(np.int64), n_uv_layers)
+	return _decode_bitmask_faces(raw.tolist(), n_uv_layers)
+
+
+def first_invalid_face(triangles: np.ndarray, n_vertices: int) -> int:
+	"""Row of the first triangle indexing outside [0, n_vertices), or -1."""
+	# Valid meshes scan every index anyway, so a vectorized pass beats an
+	# early-exit kernel that would cost a JIT compile per process
+	bad = np.flatnonzero(((triangles < 0) | (triangles >= n_vertices)).any(axis=1))
+	return int(bad[0]) if bad.size else -1
@@ -2,18 +2,46 @@
 
 from __future__ import annotations
 
+import functools
 import json
+import mmap
 import re
+import threading
+import warnings
+from collections.abc import Mapping
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from models.mesh import (
+	COORD_DTYPE,
 	Vertex,
 	MeshGeometry,
+	MeshMeta,
 	MeshScene,
 	BeamGeometry,
 	SlabGeometry,
 )
+from utils._mesh_numba import decode_faces, first_invalid_face
+
+# Fastest available parser for raw bytes: orjson, then ujson, then stdlib json.
+try:
+	import orjson
+	_json_loads = orjson.loads
+except ImportError:  # optional
+	orjson = None
+	try:
+		import ujson
+		_json_loads = ujson.loads
+	except ImportError:
+		_json_loads = json.loads
+
+try:
+	import ijson
+except ImportError:  # optional: fall back to full-document parsing
+	ijson = None
 
 
 class MeshParseError(RuntimeError):
@@ -22,22 +50,99 @@ class MeshParseError(RuntimeError):
 
 def load_json(path: Path) -> Dict[str, Any]:
 	try:
-		with path.open("r", encoding="utf-8") as f:
-			return json.load(f)
+		if orjson is not None and path.stat().st_size >= MMAP_THRESHOLD_BYTES:
+			# orjson parses straight from the mapped pages; no heap copy of the file
+			with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+				with memoryview(mm) as view:
+					return orjson.loads(view)
+		raw = path.read_bytes()
+		return _json_loads(raw)
 	except FileNotFoundError as e:
 		raise MeshParseError(f"File not found: {path}") from e
-	except json.JSONDecodeError as e:
+	except ValueError as e:
+		# Decode errors from all three parsers (and bad UTF-8) are ValueErrors
 		raise MeshParseError(f"Invalid JSON: {e}") from e
 
 
+# Files at least this large are memory-mapped rather than read into a bytes
+# object before decoding (orjson only); below it the mmap setup is not worth it.
+MMAP_THRESHOLD_BYTES = 16 * 1024 * 1024
+
+# Scene files at least this large are stream-parsed when ijson is installed;
+# smaller ones are faster to decode in a single pass.
+STREAMING_THRESHOLD_BYTES = 16 * 1024 * 1024
+
+_CARBON_KEYS = frozenset(("CarbonEmission", "CarbonEmmision"))
+
+_POINT_RE = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+
+
 def parse_point_string(point_str: str) -> Vertex:
 	"""Parse point string like '{-37, -26, 8.666667}' into Vertex."""
-	# Remove braces and split by comma
-	clean_str = point_str.strip('{}')
-	coords = [float(x.strip()) for x in clean_str.split(',')]
+	if not isinstance(point_str, str):
+		raise MeshParseError(f"Invalid point format: {point_str!r}")
+	# Common '{x, y, z}' form: split + float() is about twice as fast as the regex
+	parts = point_str.strip("{} ").split(",")
+	if len(parts) == 3:
+		try:
+			return Vertex(float(parts[0]), float(parts[1]), float(parts[2]))
+		except ValueError:
+			pass
+	coords = _POINT_RE.findall(point_str)
 	if len(coords) != 3:
 		raise MeshParseError(f"Invalid point format: {point_str}")
-	return Vertex(coords[0], coords[1], coords[2])
+	return Vertex(float(coords[0]), float(coords[1]), float(coords[2]))
+
+
+def parse_point_strings(point_strs: Sequence[str]) -> np.ndarray:
+	"""Parse many point strings in a single pass into an (N, 3) array."""
+	for s in point_strs:
+		if not isinstance(s, str):
+			raise MeshParseError(f"Invalid point format: {s!r}")
+	stripped = [s.strip("{} ") for s in point_strs]
+	# Check arity per string: a short point next to a long one would otherwise
+	# keep the total count right while shifting values into its neighbour.
+	for s in stripped:
+		if s.count(",") != 2:
+			raise MeshParseError(f"Invalid point format: {{{s}}}")
+	joined = ",".join(stripped)
+	with warnings.catch_warnings():
+		# Older NumPy warns instead of raising on unparsable trailing data.
+		warnings.simplefilter("error", DeprecationWarning)
+		try:
+			coords = np.fromstring(joined, sep=",")
+		except (ValueError, DeprecationWarning) as e:
+			raise MeshParseError(f"Invalid point data: {e}") from None
+	if coords.size != 3 * len(point_strs):
+		raise MeshParseError("Invalid point format: expected 3 coordinates per point")
+	return coords.reshape(-1, 3)
+
+
+class LazyStrDict(Mapping):
+	"""Read-only string view over a source element, minus excluded keys.
+
+	Values are stringified on access, so metadata nobody reads costs nothing.
+	"""
+
+	__slots__ = ("_d", "_exclude")
+
+	def __init__(self, source: Dict[str, Any], exclude: frozenset):
+		self._d = source
+		self._exclude = exclude
+
+	def __getitem__(self, key: str) -> str:
+		if key in self._exclude:
+			raise KeyError(key)
+		return str(self._d[key])
+
+	def __iter__(self) -> Iterator[str]:
+		return (k for k in self._d if k not in self._exclude)
+
+	def __len__(self) -> int:
+		return sum(1 for k in self._d if k not in self._exclude)
+
+	def __repr__(self) -> str:
+		return repr(dict(self))
 
 
 def _parse_carbon(value: Any) -> float | None:
@@ -85,41 +190,74 @@ def _parse_linear_elements(
 	end_key: str = "PointEnd",
 ) -> Tuple[List[BeamGeometry], Dict[str, Any]]:
 	elements_payload, meta = _extract_system_payload(system_data)
+	get_endpoints = itemgetter(start_key, end_key)
+	try:
+		# One pass over interleaved start/end strings -> (N, 2, 3)
+		endpoints = parse_point_strings(
+			[point for elem in elements_payload for point in get_endpoints(elem)]
+		).reshape(-1, 2, 3).tolist()
+	except (KeyError, TypeError, MeshParseError):
+		# Parse element by element below so the offending one is reported.
+		endpoints = None
+
+	exclude = frozenset((start_key, end_key)).union(_CARBON_KEYS)
 	linear_elements: List[BeamGeometry] = []
-	for idx, elem in enumerate(elements_payload):
-		try:
-			start_raw = elem.get(start_key)
-			end_raw = elem.get(end_key)
-			if start_raw is None or end_raw is None:
-				raise MeshParseError(f"Missing start/end point in element {idx}")
-			start_point = parse_point_string(start_raw)
-			end_point = parse_point_string(end_raw)
+	# One handler for the whole loop; `idx` tells which element failed.
+	idx = 0
+	try:
+		for idx, elem in enumerate(elements_payload):
+			if endpoints is not None:
+				start, end = endpoints[idx]
+				start_point = Vertex(*start)
+				end_point = Vertex(*end)
+			else:
+				start_raw = elem.get(start_key)
+				end_raw = elem.get(end_key)
+				if start_raw is None or end_raw is None:
+					raise MeshParseError(f"Missing start/end point in element {idx}")
+				start_point = parse_point_string(start_raw)
+				end_point = parse_point_string(end_raw)
 			carbon_val = _parse_carbon(elem.get("CarbonEmission") or elem.get("CarbonEmmision"))
-			linear_elements.append(
-				BeamGeometry(
-					name=f"{element_prefix}_{idx:03d}",
-					start_point=start_point,
-					end_point=end_point,
-					embodied_carbon=carbon_val,
-					structural_type=structural_type,
-					meta={k: str(v) for k, v in elem.items() if k not in {start_key, end_key, "CarbonEmission", "CarbonEmmision"}}
-				)
-			)
-		except (ValueError, TypeError) as e:
-			raise MeshParseError(f"Failed to parse {structural_type.lower()} {idx}: {e}")
+			linear_elements.append(BeamGeometry(
+				name=f"{element_prefix}_{idx:03d}",
+				start_point=start_point,
+				end_point=end_point,
+				embodied_carbon=carbon_val,
+				structural_type=structural_type,
+				meta=LazyStrDict(elem, exclude)
+			))
+	except (ValueError, TypeError) as e:
+		raise MeshParseError(f"Failed to parse {structural_type.lower()} {idx}: {e}") from e
 	return linear_elements, meta
 
 
 def _parse_slab_system(system_data: Any, element_prefix: str = "Slab") -> Tuple[List[SlabGeometry], Dict[str, Any]]:
 	elements_payload, meta = _extract_system_payload(system_data)
-	slabs: List[SlabGeometry] = []
+	slab_corner_keys: List[List[str]] = []
 	for idx, elem in enumerate(elements_payload):
 		corner_keys = [k for k in elem.keys() if k.lower().startswith("point")]
 		if not corner_keys:
 			raise MeshParseError(f"Slab {idx} missing corner points")
 		# Sort corners by numeric suffix to preserve order (Point1, Point2, ...)
 		corner_keys.sort(key=lambda k: int(''.join(filter(str.isdigit, k)) or 0))
-		corners = [parse_point_string(elem[k]) for k in corner_keys]
+		slab_corner_keys.append(corner_keys)
+
+	try:
+		all_corners = parse_point_strings(
+			[elem[k] for elem, corner_keys in zip(elements_payload, slab_corner_keys) for k in corner_keys]
+		).tolist()
+	except (TypeError, MeshParseError):
+		# Parse slab by slab below so the offending point is reported.
+		all_corners = None
+
+	slabs: List[SlabGeometry] = []
+	offset = 0
+	for idx, (elem, corner_keys) in enumerate(zip(elements_payload, slab_corner_keys)):
+		if all_corners is not None:
+			corners = [Vertex(*c) for c in all_corners[offset:offset + len(corner_keys)]]
+			offset += len(corner_keys)
+		else:
+			corners = [parse_point_string(elem[k]) for k in corner_keys]
 		carbon_val = _parse_carbon(elem.get("CarbonEmission") or elem.get("CarbonEmmision"))
 		slabs.append(
 			SlabGeometry(
@@ -127,124 +265,228 @@ def _parse_slab_system(system_data: Any, element_prefix: str = "Slab") -> Tuple[
 				corners=corners,
 				embodied_carbon=carbon_val,
 				structural_type="Floor",
-				meta={k: str(v) for k, v in elem.items() if k not in corner_keys + ["CarbonEmission", "CarbonEmmision"]}
+				meta=LazyStrDict(elem, frozenset(corner_keys).union(_CARBON_KEYS))
 			)
 		)
 	return slabs, meta
 
 
+def _apply_frame_entry(scene: MeshScene, key: str, value: Any) -> None:
+	"""Dispatch a single StructuralFrame key/value pair into `scene`."""
+	if key == "BeamSystem":
+		parsed_beams, beam_meta = _parse_linear_elements(value, "Beam", "Beam")
+		scene.beams.extend(parsed_beams)
+		_merge_metadata(scene.metadata, beam_meta)
+	elif key == "ColumnSystem":
+		parsed_columns, column_meta = _parse_linear_elements(value, "Column", "Column")
+		scene.columns.extend(parsed_columns)
+		_merge_metadata(scene.metadata, column_meta)
+	elif key == "SlabSystem":
+		parsed_slabs, slab_meta = _parse_slab_system(value, element_prefix="Floor")
+		scene.slabs.extend(parsed_slabs)
+		_merge_metadata(scene.metadata, slab_meta)
+	elif key == "TotalCO2":
+		scene.metadata["totalCO2"] = _parse_carbon(value)
+
+
 def parse_structural_frame(data: Dict[str, Any]) -> MeshScene:
 	"""Parse StructuralFrame payloads (beams, columns, slabs)."""
 	structural_frame = data.get("StructuralFrame")
 	if structural_frame is None:
 		return MeshScene()
 
-	beams: List[BeamGeometry] = []
-	columns: List[BeamGeometry] = []
-	slabs: List[SlabGeometry] = []
-	metadata: Dict[str, Any] = {}
+	scene = MeshScene()
 
 	# Support both dict and list variants
 	if isinstance(structural_frame, dict):
-		if "BeamSystem" in structural_frame:
-			parsed_beams, beam_meta = _parse_linear_elements(structural_frame["BeamSystem"], "Beam", "Beam")
-			beams.extend(parsed_beams)
-			_merge_metadata(metadata, beam_meta)
-		if "ColumnSystem" in structural_frame:
-			parsed_columns, column_meta = _parse_linear_elements(structural_frame["ColumnSystem"], "Column", "Column")
-			columns.extend(parsed_columns)
-			_merge_metadata(metadata, column_meta)
-		if "SlabSystem" in structural_frame:
-			parsed_slabs, slab_meta = _parse_slab_system(structural_frame["SlabSystem"], element_prefix="Floor")
-			slabs.extend(parsed_slabs)
-			_merge_metadata(metadata, slab_meta)
+		for key, value in structural_frame.items():
+			_apply_frame_entry(scene, key, value)
 	else:
 		for entry in structural_frame:
 			if not isinstance(entry, dict):
 				continue
-			if "BeamSystem" in entry:
-				parsed_beams, beam_meta = _parse_linear_elements(entry["BeamSystem"], "Beam", "Beam")
-				beams.extend(parsed_beams)
-				_merge_metadata(metadata, beam_meta)
-			if "ColumnSystem" in entry:
-				parsed_columns, column_meta = _parse_linear_elements(entry["ColumnSystem"], "Column", "Column")
-				columns.extend(parsed_columns)
-				_merge_metadata(metadata, column_meta)
-			if "SlabSystem" in entry:
-				parsed_slabs, slab_meta = _parse_slab_system(entry["SlabSystem"], element_prefix="Floor")
-				slabs.extend(parsed_slabs)
-				_merge_metadata(metadata, slab_meta)
-			if "TotalCO2" in entry:
-				metadata["totalCO2"] = _parse_carbon(entry.get("TotalCO2"))
-
-	return MeshScene(meshes=[], beams=beams, columns=columns, slabs=slabs, metadata=metadata)
+			for key, value in entry.items():
+				_apply_frame_entry(scene, key, value)
+
+	return scene
+
+
+# Top-level keys only a Three.js scene has; meeting one first settles the format
+_THREEJS_KEYS = frozenset({"geometries", "object"})
+
+
+def _structural_frame_prefix(fp: BinaryIO, stop_keys: Iterable[str] = ()) -> Optional[str]:
+	"""ijson prefix holding the StructuralFrame systems, or None if there are none.
+
+	Reads only up to the opening of the StructuralFrame value: the list variant
+	keeps its systems in the items, the dict variant directly. Meeting a
+	top-level key in `stop_keys` first also ends the read with None.
+	"""
+	for prefix, event, value in ijson.parse(fp):
+		if not prefix and event == "map_key" and value in stop_keys:
+			return None
+		if prefix == "StructuralFrame":
+			if event == "start_array":
+				return "StructuralFrame.item"
+			if event == "start_map":
+				return "StructuralFrame"
+			return None
+	return None
+
+
+def iter_structural_frame(fp: BinaryIO) -> Iterator[Tuple[str, Any]]:
+	"""Yield StructuralFrame (key, value) pairs from a seekable binary JSON stream.
+
+	Only one system (e.g. a whole BeamSystem) is materialized at a time, so the
+	rest of the document never has to be held in memory.
+	"""
+	prefix = _structural_frame_prefix(fp)
+	if prefix is None:
+		return
+	fp.seek(0)
+	yield from ijson.kvitems(fp, prefix, use_float=True)
+
+
+def parse_structural_frame_stream(fp: BinaryIO) -> Optional[MeshScene]:
+	"""Stream-parse StructuralFrame payloads; None if the stream has none."""
+	scene: Optional[MeshScene] = None
+	for key, value in iter_structural_frame(fp):
+		if scene is None:
+			scene = MeshScene()
+		_apply_frame_entry(scene, key, value)
+	return scene
+
+
+def load_structural_frame_stream(path: Path) -> Optional[MeshScene]:
+	try:
+		with path.open("rb") as f:
+			return parse_structural_frame_stream(f)
+	except FileNotFoundError as e:
+		raise MeshParseError(f"File not found: {path}") from e
+	except ijson.JSONError as e:
+		raise MeshParseError(f"Invalid JSON: {e}") from e
+
+
+def _mesh_names(children: Iterable[Any]) -> Dict[str, str]:
+	"""Map geometry uuid -> name from object.children."""
+	return {child.get("geometry"): child.get("name", "mesh") for child in children if child.get("type") == "Mesh"}
+
+
+def _parse_geometry(g: Dict[str, Any], name: str) -> MeshGeometry:
+	uuid = g.get("uuid")
+	dataset = g.get("data") or {}
+	raw_vertices = dataset.get("vertices", [])
+	raw_faces = dataset.get("faces", [])
+
+	# Flat x,y,z list -> (N, 3) coordinate array
+	if len(raw_vertices) % 3 != 0:
+		raise MeshParseError(f"Vertex array length not multiple of 3 for {name}")
+	try:
+		vertices = np.fromiter(raw_vertices, dtype=COORD_DTYPE, count=len(raw_vertices)).reshape(-1, 3)
+	except (TypeError, ValueError, OverflowError) as e:
+		raise MeshParseError(f"Invalid vertex data for {name}: {e}") from e
+
+	# Faces pattern is a bitmask flag followed by the face's indices; usually 0, a, b, c repeating.
+	faces = np.empty((0, 3), dtype=np.int32)
+	if raw_faces:
+		try:
+			faces = decode_faces(np.fromiter(raw_faces, dtype=np.int32, count=len(raw_faces)), len(dataset.get("uvs") or []))
+		except (TypeError, ValueError, OverflowError) as e:
+			raise MeshParseError(f"Invalid face data for {name}: {e}") from e
+		bad_face = first_invalid_face(faces, vertices.shape[0])
+		if bad_face >= 0:
+			raise MeshParseError(f"Face {bad_face} references a missing vertex in {name}")
+
+	carbon = dataset.get("embodiedCarbon")
+	try:
+		carbon_val = float(carbon) if carbon is not None else None
+	except (TypeError, ValueError):
+		carbon_val = None
+	
+	structuralType = dataset.get("structural_type")
+	if structuralType is not None and not isinstance(structuralType, str):
+		structuralType = str(structuralType)
+
+	return MeshGeometry(
+		name=name,
+		vertices=vertices,
+		faces=faces,
+		meta=MeshMeta(uuid=uuid or "", vertex_count=vertices.shape[0]),
+		embodied_carbon=carbon_val,
+		structural_type=structuralType
+	)
 
 
 def parse_scene(data: Dict[str, Any]) -> MeshScene:
-	geometries = data.get("geometries", [])
+	uuid_name_map = _mesh_names(data.get("object", {}).get("children", []))
 	meshes: List[MeshGeometry] = []
+	for g in data.get("geometries", []):
+		uuid = g.get("uuid")
+		meshes.append(_parse_geometry(g, uuid_name_map.get(uuid, uuid or f"mesh_{len(meshes)}")))
+	return MeshScene(meshes=meshes)
 
-	# Map geometry uuid -> name from object.children
-	uuid_name_map: Dict[str, str] = {}
-	for child in data.get("object", {}).get("children", []):
-		if child.get("type") == "Mesh":
-			uuid_name_map[child.get("geometry")] = child.get("name", "mesh")
 
-	for g in geometries:
-		uuid = g.get("uuid")
-		name = uuid_name_map.get(uuid, uuid or f"mesh_{len(meshes)}")
-		dataset = g.get("data") or {}
-		raw_vertices = dataset.get("vertices", [])
-		raw_faces = dataset.get("faces", [])
-
-		# Convert flat vertex list to Vertex objects
-		if len(raw_vertices) % 3 != 0:
-			raise MeshParseError(f"Vertex array length not multiple of 3 for {name}")
-		vertices = [
-			Vertex(raw_vertices[i], raw_vertices[i + 1], raw_vertices[i + 2])
-			for i in range(0, len(raw_vertices), 3)
-		]
-
-		# Faces pattern appears as: 0, a, b, c repeating. Validate length % 4 == 0.
-		faces: List[Tuple[int, int, int]] = []
-		if raw_faces:
-			if len(raw_faces) % 4 != 0:
-				raise MeshParseError(f"Faces array length not multiple of 4 for {name}")
-			for i in range(0, len(raw_faces), 4):
-				flag = raw_faces[i]
-				a, b, c = raw_faces[i + 1 : i + 4]
-				if flag != 0:
-					# Future: handle bitmask flags; for now we only accept 0.
-					raise MeshParseError(f"Unsupported face flag {flag} in {name}")
-				faces.append((a, b, c))
-
-		carbon = dataset.get("embodiedCarbon")
-		try:
-			carbon_val = float(carbon) if carbon is not None else None
-		except (TypeError, ValueError):
-			carbon_val = None
-		
-		try:
-			structuralType = str(dataset.get("structural_type")) if dataset.get("structural_type") is not None else None
-		except (TypeError, ValueError):
-			structuralType = None
-
-		meshes.append(
-			MeshGeometry(
-				name=name,
-				vertices=vertices,
-				faces=faces,
-				meta={"uuid": uuid or "", "vertex_count": str(len(vertices))},
-				embodied_carbon=carbon_val,
-				structural_type=structuralType
-			)
-		)
+def parse_scene_stream(fp: BinaryIO) -> MeshScene:
+	"""Stream-parse a Three.js scene from a seekable binary JSON stream.
 
+	Geometries are converted to arrays one at a time, so only a single raw
+	vertex list is alive at once. Mesh names live in object.children, which
+	usually follows the geometries, so they are applied in a second pass.
+	"""
+	meshes: List[MeshGeometry] = []
+	for g in ijson.items(fp, "geometries.item", use_float=True):
+		meshes.append(_parse_geometry(g, g.get("uuid") or f"mesh_{len(meshes)}"))
+	if meshes:
+		fp.seek(0)
+		uuid_name_map = _mesh_names(ijson.items(fp, "object.children.item", use_float=True))
+		for mesh in meshes:
+			name = uuid_name_map.get(mesh.meta.uuid or None)
+			if name is not None:
+				mesh.name = name
 	return MeshScene(meshes=meshes)
 
 
-def load_scene(path: Path) -> MeshScene:
-	"""Load scene from JSON, auto-detecting format."""
+def load_scene_stream(path: Path) -> MeshScene:
+	try:
+		with path.open("rb") as f:
+			return parse_scene_stream(f)
+	except FileNotFoundError as e:
+		raise MeshParseError(f"File not found: {path}") from e
+	except ijson.JSONError as e:
+		raise MeshParseError(f"Invalid JSON: {e}") from e
+
+
+def load_scene_streaming(path: Path) -> MeshScene:
+	"""Stream-parse a scene of either format without decoding the whole document.
+
+	Peak memory is bounded by the largest single system or geometry rather
+	than the file size. Requires ijson.
+	"""
+	if ijson is None:
+		raise MeshParseError("Streaming scene parsing requires the ijson package")
+	try:
+		with path.open("rb") as f:
+			# A short read up to the first telling key picks the format, so only
+			# the matching streaming pass scans the whole file
+			prefix = _structural_frame_prefix(f, _THREEJS_KEYS)
+			f.seek(0)
+			if prefix is None:
+				# Fall back to old Three.js format
+				return parse_scene_stream(f)
+			scene = MeshScene()
+			for key, value in ijson.kvitems(f, prefix, use_float=True):
+				_apply_frame_entry(scene, key, value)
+			return scene
+	except FileNotFoundError as e:
+		raise MeshParseError(f"File not found: {path}") from e
+	except ijson.JSONError as e:
+		raise MeshParseError(f"Invalid JSON: {e}") from e
+
+
+def _parse_scene_file(path: Path, size: int) -> MeshScene:
+	if ijson is not None and size >= STREAMING_THRESHOLD_BYTES:
+		return load_scene_streaming(path)
+
 	data = load_json(path)
 	
 	# Check if it's the new StructuralFrame format
@@ -254,3 +496,39 @@ def load_scene(path: Path) -> MeshScene:
 		# Fall back to old Three.js format
 		return parse_scene(data)
 
+
+@functools.lru_cache(maxsize=8)
+def _load_scene_cached(path_str: str, mtime_ns: int, size: int) -> MeshScene:
+	return _parse_scene_file(Path(path_str), size)
+
+
+# One lock per path, so concurrent reruns loading the same file parse it once
+_scene_locks: Dict[str, threading.Lock] = {}
+_scene_locks_guard = threading.Lock()
+
+
+def _scene_lock(path_str: str) -> threading.Lock:
+	with _scene_locks_guard:
+		return _scene_locks.setdefault(path_str, threading.Lock())
+
+
+def load_scene(path: Path) -> MeshScene:
+	"""Load scene from JSON, auto-detecting format.
+
+	Parsed scenes are cached per (resolved path, mtime, size), so reloading an
+	unchanged file skips parsing. The returned scene is shared between
+	callers and should be treated as read-only.
+	"""
+	try:
+		resolved = path.resolve()
+		stat = resolved.stat()
+	except FileNotFoundError as e:
+		raise MeshParseError(f"File not found: {path}") from e
+	path_str = str(resolved)
+	with _scene_lock(path_str):
+		return _load_scene_cached(path_str, stat.st_mtime_ns, stat.st_size)
+
+
+def clear_scene_cache() -> None:
+	"""Drop all cached scenes, e.g. after editing a file in place within one mtime tick."""
+	_load_scene_cached.cache_clear()